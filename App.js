@@ -20,6 +20,16 @@ const paragraphs = {
   "Shakespeare": "To be, or not to be, that is the question. Whether 'tis nobler in the mind to suffer the slings and arrows of outrageous fortune."
 };
 
+const paragraphNames = Object.keys(paragraphs);
+
+// The option list is static, so build the picker items once instead of on every render.
+const paragraphPickerItems = [
+  <Picker.Item key="" label="Select Paragraph" value="" />,
+  ...paragraphNames.map((key) => (
+    <Picker.Item key={key} label={key} value={key} />
+  )),
+];
+
 const TypingTest = () => {
   const [selectedParagraph, setSelectedParagraph] = useState("");
   const [currentText, setCurrentText] = useState("");
@@ -111,10 +121,7 @@ const TypingTest = () => {
           onValueChange={onParagraphSelect}
           style={styles.picker}
         >
-          <Picker.Item label="Select Paragraph" value="" />
-          {Object.keys(paragraphs).map((key) => (
-            <Picker.Item key={key} label={key} value={key} />
-          ))}
+          {paragraphPickerItems}
         </Picker>
       </View>
     </View>